@@ -3,7 +3,7 @@ import os
 from .. import config
 from ..project import projects
 from ..sqlite import SubstitutableDatabase
-from .schema import ActivityDataset, ExchangeDataset, get_id
+from .schema import ActivityDataset, ExchangeDataset, get_id, invalidate_id_cache
 
 sqlite3_lci_db = SubstitutableDatabase(
     projects.dir / "lci" / "databases.db",
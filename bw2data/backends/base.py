@@ -31,7 +31,7 @@ from ..search import IndexManager, Searcher
 from ..utils import as_uncertainty_dict, get_geocollection, get_node
 from . import sqlite3_lci_db
 from .proxies import Activity
-from .schema import ActivityDataset, ExchangeDataset, get_id
+from .schema import ActivityDataset, ExchangeDataset, invalidate_id_cache
 from .typos import (
     check_activity_keys,
     check_activity_type,
@@ -42,6 +42,7 @@ from .utils import (
     check_exchange,
     dict_as_activitydataset,
     dict_as_exchangedataset,
+    executemany_rows,
     get_csv_data_dict,
     retupleize_geo_strings,
 )
@@ -65,7 +66,7 @@ class SQLiteBackend(ProcessedDataStore):
     * ``load()``
     * ``write(data)``
 
-    In addition, they should specify their backend with the ``backend`` attribute (a unicode string).
+    In addition, they should specify their backend with the ``backend`` attribute (a string).
 
     * ``rename``
     * ``copy``
@@ -87,15 +88,15 @@ class SQLiteBackend(ProcessedDataStore):
 
         exchange = {
                 Required("input"): valid_tuple,
-                Required("type"): basestring,
+                Required("type"): str,
                 }
         exchange.update(uncertainty_dict)
         lci_dataset = {
             Optional("categories"): Any(list, tuple),
             Optional("location"): object,
-            Optional("unit"): basestring,
-            Optional("name"): basestring,
-            Optional("type"): basestring,
+            Optional("unit"): str,
+            Optional("name"): str,
+            Optional("type"): str,
             Optional("exchanges"): [exchange]
         }
         db_validator = Schema({valid_tuple: lci_dataset}, extra=True)
@@ -107,7 +108,7 @@ class SQLiteBackend(ProcessedDataStore):
     Processing a Database actually produces two parameter arrays: one for the exchanges, which make up the technosphere and biosphere matrices, and a geomapping array which links activities to locations.
 
     Args:
-        *name* (unicode string): Name of the database to manage.
+        *name* (str): Name of the database to manage.
 
     """
 
@@ -117,7 +118,7 @@ class SQLiteBackend(ProcessedDataStore):
     node_class = Activity
 
     def __init__(self, *args, **kwargs):
-        super(SQLiteBackend, self).__init__(*args, **kwargs)
+        super().__init__(*args, **kwargs)
 
         self._filters = {}
         self._order_by = None
@@ -321,7 +322,7 @@ class SQLiteBackend(ProcessedDataStore):
         return self._get_queryset().count()
 
     def __contains__(self, obj):
-        return self._get_queryset(filters={"code": obj[1]}).count() > 0
+        return self._get_queryset(filters={"code": obj[1]}).exists()
 
     @property
     def _searchable(self):
@@ -444,13 +445,10 @@ class SQLiteBackend(ProcessedDataStore):
             exchange["output"] = key
             exchanges.append(dict_as_exchangedataset(exchange))
 
-            # Query gets passed as INSERT INTO x VALUES ('?', '?'...)
-            # SQLite3 has a limit of 999 variables,
-            # So 6 fields * 125 is under the limit
-            # Otherwise get the following:
-            # peewee.OperationalError: too many SQL variables
-            if len(exchanges) > 125:
-                ExchangeDataset.insert_many(exchanges).execute()
+            # Rows are inserted with ``executemany``, so there is no limit on
+            # SQL variables; batching only bounds memory use
+            if len(exchanges) > 1000:
+                executemany_rows(ExchangeDataset, exchanges)
                 exchanges = []
 
         ds = {k: v for k, v in ds.items() if k != "exchanges"}
@@ -463,8 +461,8 @@ class SQLiteBackend(ProcessedDataStore):
 
         activities.append(dict_as_activitydataset(ds))
 
-        if len(activities) > 125:
-            ActivityDataset.insert_many(activities).execute()
+        if len(activities) > 1000:
+            executemany_rows(ActivityDataset, activities)
             activities = []
 
         return exchanges, activities
@@ -475,30 +473,26 @@ class SQLiteBackend(ProcessedDataStore):
         be_complicated = len(data) >= 100 and indices
         if be_complicated:
             self._drop_indices()
-        sqlite3_lci_db.db.autocommit = False
         try:
-            sqlite3_lci_db.db.begin()
-            self.delete(keep_params=True, warn=False, vacuum=False)
-            exchanges, activities = [], []
-
-            for key, ds in tqdm_wrapper(
-                data.items(), getattr(config, "is_test", False)
-            ):
-                exchanges, activities = self._efficient_write_dataset(
-                    key, ds, exchanges, activities, check_typos
-                )
+            with sqlite3_lci_db.atomic():
+                self.delete(keep_params=True, warn=False, vacuum=False)
+                exchanges, activities = [], []
+
+                for key, ds in tqdm_wrapper(
+                    data.items(), getattr(config, "is_test", False)
+                ):
+                    exchanges, activities = self._efficient_write_dataset(
+                        key, ds, exchanges, activities, check_typos
+                    )
 
-            if activities:
-                ActivityDataset.insert_many(activities).execute()
-            if exchanges:
-                ExchangeDataset.insert_many(exchanges).execute()
-            sqlite3_lci_db.db.commit()
+                if activities:
+                    executemany_rows(ActivityDataset, activities)
+                if exchanges:
+                    executemany_rows(ExchangeDataset, exchanges)
             sqlite3_lci_db.vacuum()
-        except:
-            sqlite3_lci_db.db.rollback()
-            raise
         finally:
-            sqlite3_lci_db.db.autocommit = True
+            # Also after a rollback, in case the cache was built mid-transaction
+            invalidate_id_cache()
             if be_complicated:
                 self._add_indices()
 
@@ -530,40 +524,42 @@ class SQLiteBackend(ProcessedDataStore):
                 )
             )
 
-        databases[self.name]["number"] = len(data)
+        # Metadata is changed several times during writing; only save it once
+        with databases.batch():
+            databases[self.name]["number"] = len(data)
 
-        databases.set_modified(self.name)
-        geocollections = {
-            get_geocollection(x.get("location"))
-            for x in data.values()
-            if x.get("type") in labels.process_node_types
-        }
-        if None in geocollections:
-            print(
-                "Not able to determine geocollections for all datasets. This database is not ready for regionalization."
-            )
-            geocollections.discard(None)
-        databases[self.name]["geocollections"] = sorted(geocollections)
-        # processing will flush the database metadata
+            databases.set_modified(self.name)
+            geocollections = {
+                get_geocollection(x.get("location"))
+                for x in data.values()
+                if x.get("type") in labels.process_node_types
+            }
+            if None in geocollections:
+                print(
+                    "Not able to determine geocollections for all datasets. This database is not ready for regionalization."
+                )
+                geocollections.discard(None)
+            databases[self.name]["geocollections"] = sorted(geocollections)
+            # processing will flush the database metadata
 
-        geomapping.add({x["location"] for x in data.values() if x.get("location")})
-        if data:
-            try:
-                self._efficient_write_many_data(data, check_typos=check_typos)
-            except:
-                # Purge all data from database, then reraise
-                self.delete(warn=False)
-                raise
+            geomapping.add({x["location"] for x in data.values() if x.get("location")})
+            if data:
+                try:
+                    self._efficient_write_many_data(data, check_typos=check_typos)
+                except:
+                    # Purge all data from database, then reraise
+                    self.delete(warn=False)
+                    raise
 
-        if searchable:
-            self.make_searchable(reset=True)
+            if searchable:
+                self.make_searchable(reset=True)
 
-        if process:
-            self.process()
+            if process:
+                self.process()
 
     def load(self, *args, **kwargs):
         # Should not be used, in general; relatively slow
-        activities = [obj["data"] for obj in self._get_queryset().dicts()]
+        activities = [obj["data"] for obj in self._get_queryset().dicts().iterator()]
 
         activities = {(o["database"], o["code"]): o for o in activities}
         for o in activities.values():
@@ -573,6 +569,7 @@ class SQLiteBackend(ProcessedDataStore):
             ExchangeDataset.select(ExchangeDataset.data)
             .where(ExchangeDataset.output_database == self.name)
             .dicts()
+            .iterator()
         )
 
         for exc in exchange_qs:
@@ -612,14 +609,14 @@ Here are the type values usually used for nodes:
                 (ActivityDataset.database == self.name)
                 & (ActivityDataset.code == obj["code"])
             )
-            .count()
+            .exists()
         ):
             raise DuplicateNode("Node with this database / code combo already exists")
         if (
             "id" in kwargs
             and ActivityDataset.select()
-            .where(ActivityDataset.id == int("id" in kwargs))
-            .count()
+            .where(ActivityDataset.id == int(kwargs["id"]))
+            .exists()
         ):
             raise DuplicateNode("Node with this id already exists")
 
@@ -659,6 +656,7 @@ Here are the type values usually used for nodes:
         ExchangeDataset.delete().where(
             ExchangeDataset.output_database == self.name
         ).execute()
+        invalidate_id_cache()
         IndexManager(self.filename).delete_database()
 
         if not keep_params:
@@ -753,7 +751,7 @@ Here are the type values usually used for nodes:
                     ],
                     "amount": 1,
                 }
-                for row in inv_mapping_qs.tuples()
+                for row in inv_mapping_qs.tuples().iterator()
             ),
             nrows=inv_mapping_qs.count(),
         )
@@ -803,9 +801,9 @@ Here are the type values usually used for nodes:
 
         # Figure out when the production exchanges are implicit
         implicit_production = (
-            {"row": get_id((self.name, x[0])), "amount": 1}
-            # Get all codes
-            for x in ActivityDataset.select(ActivityDataset.code)
+            {"row": x[0], "amount": 1}
+            # Get ids directly instead of looking up each code separately
+            for x in ActivityDataset.select(ActivityDataset.id)
             .where(
                 # Get correct database name
                 ActivityDataset.database == self.name,
@@ -824,6 +822,7 @@ Here are the type values usually used for nodes:
                 ),
             )
             .tuples()
+            .iterator()
         )
 
         TECHNOSPHERE_POSITIVE_SQL = """SELECT e.data, a.id, b.id, e.input_database, e.input_code, e.output_database, e.output_code
@@ -953,11 +952,12 @@ Here are the type values usually used for nodes:
             for exchange in act.exchanges():
                 exchange_mapping[get_uniqueness_key(exchange, fields)].append(exchange)
 
-        for lst in exchange_mapping.values():
-            if len(lst) > 1:
-                for exc in lst[-1:0:-1]:
-                    print("Deleting exchange:", exc)
-                    exc.delete()
+        with sqlite3_lci_db.atomic():
+            for lst in exchange_mapping.values():
+                if len(lst) > 1:
+                    for exc in lst[-1:0:-1]:
+                        print("Deleting exchange:", exc)
+                        exc.delete()
 
     def nodes_to_dataframe(
         self, columns: Optional[List[str]] = None, return_sorted: bool = True
@@ -11,14 +11,19 @@ from ..errors import ValidityError
 from ..proxies import ActivityProxyBase, ExchangeProxyBase
 from ..search import IndexManager
 from . import sqlite3_lci_db
-from .schema import ActivityDataset, ExchangeDataset
+from .schema import (
+    ActivityDataset,
+    ExchangeDataset,
+    add_to_id_cache,
+    invalidate_id_cache,
+)
 from .typos import (
     check_activity_keys,
     check_activity_type,
     check_exchange_keys,
     check_exchange_type,
 )
-from .utils import dict_as_activitydataset, dict_as_exchangedataset
+from .utils import dict_as_activitydataset, dict_as_exchangedataset, executemany_rows
 
 
 class Exchanges(Iterable):
@@ -246,7 +251,7 @@ class Activity(ActivityProxyBase):
             self._change_database(value)
             print("Successfully switch activity dataset to database `{}`".format(value))
         else:
-            super(Activity, self).__setitem__(key, value)
+            super().__setitem__(key, value)
 
     @property
     def key(self):
@@ -269,6 +274,7 @@ class Activity(ActivityProxyBase):
         IndexManager(Database(self["database"]).filename).delete_dataset(self._data)
         self.exchanges().delete()
         self._document.delete_instance()
+        invalidate_id_cache()
         self = None
 
     def save(self):
@@ -315,7 +321,10 @@ class Activity(ActivityProxyBase):
         for key, value in dict_as_activitydataset(self._data).items():
             if key != "id":
                 setattr(self._document, key, value)
+        created = self._document.id is None
         self._document.save()
+        if created:
+            add_to_id_cache(self.key, self._document.id)
 
         if self.get("location") and self["location"] not in geomapping:
             geomapping.add([self["location"]])
@@ -333,7 +342,7 @@ class Activity(ActivityProxyBase):
                 ActivityDataset.database == self["database"],
                 ActivityDataset.code == new_code,
             )
-            .count()
+            .exists()
         ):
             raise ValueError(
                 "Activity database with code `{}` already exists".format(new_code)
@@ -352,6 +361,7 @@ class Activity(ActivityProxyBase):
                 ExchangeDataset.input_database == self["database"],
                 ExchangeDataset.input_code == self["code"],
             ).execute()
+        invalidate_id_cache()
 
         if databases[self["database"]].get("searchable"):
             from .. import Database
@@ -382,6 +392,7 @@ class Activity(ActivityProxyBase):
                 ExchangeDataset.input_database == self["database"],
                 ExchangeDataset.input_code == self["code"],
             ).execute()
+        invalidate_id_cache()
 
         if databases[self["database"]].get("searchable"):
             from .. import Database
@@ -480,13 +491,17 @@ class Activity(ActivityProxyBase):
         activity._data["code"] = str(code or uuid.uuid4().hex)
         activity.save()
 
+        exchanges = []
         for exc in self.exchanges():
             data = copy.deepcopy(exc._data)
             data["output"] = activity.key
             # Change `input` for production exchanges
             if exc["input"] == exc["output"]:
                 data["input"] = activity.key
-            ExchangeDataset.create(**dict_as_exchangedataset(data))
+            exchanges.append(dict_as_exchangedataset(data))
+        if exchanges:
+            with sqlite3_lci_db.atomic():
+                executemany_rows(ExchangeDataset, exchanges)
         return activity
 
 
@@ -27,13 +27,85 @@ class ExchangeDataset(Model):
     type = TextField()  # Reset from `data`
 
 
+# Created together with the tables. Names match those dropped and recreated by
+# ``SQLiteBackend._drop_indices`` and ``SQLiteBackend._add_indices``. The key
+# index is not unique here: older projects can contain duplicate keys, and
+# creating a unique index would fail every time such a project is opened.
+ActivityDataset.add_index(
+    ActivityDataset.database,
+    ActivityDataset.code,
+    name="activitydataset_key",
+)
+ExchangeDataset.add_index(
+    ExchangeDataset.input_database,
+    ExchangeDataset.input_code,
+    name="exchangedataset_input",
+)
+ExchangeDataset.add_index(
+    ExchangeDataset.output_database,
+    ExchangeDataset.output_code,
+    name="exchangedataset_output",
+)
+
+# Lazily-built lookup of ``(database, code)`` to ``id``. Tied to the peewee
+# database it was built from, so switching projects discards it. The cache is
+# per-process: it doesn't see nodes inserted or deleted by other processes.
+# It is neither built nor read inside a transaction, as a rollback could
+# remove rows it would contain.
+_id_cache = None
+_id_cache_db = None
+
+
+def invalidate_id_cache():
+    """Discard the cached ``(database, code)`` to ``id`` lookup.
+
+    Needs to be called whenever nodes are deleted or their keys are changed.
+    """
+    global _id_cache, _id_cache_db
+    _id_cache = _id_cache_db = None
+
+
+def add_to_id_cache(key, id_):
+    """Add a newly inserted node to the cached ``(database, code)`` to ``id`` lookup.
+
+    Inside a transaction the cache is discarded instead, as the insert could
+    still be rolled back.
+    """
+    database = ActivityDataset._meta.database
+    if database.in_transaction():
+        invalidate_id_cache()
+    elif _id_cache is not None and _id_cache_db is database:
+        _id_cache[(key[0], key[1])] = id_
+
+
+def _build_id_cache():
+    global _id_cache, _id_cache_db
+    _id_cache = {
+        (database, code): id_
+        for database, code, id_ in ActivityDataset.select(
+            ActivityDataset.database, ActivityDataset.code, ActivityDataset.id
+        )
+        .tuples()
+        .iterator()
+    }
+    _id_cache_db = ActivityDataset._meta.database
+
+
 def get_id(key):
     if isinstance(key, int):
         return key
-    else:
-        try:
-            return ActivityDataset.get(
-                ActivityDataset.database == key[0], ActivityDataset.code == key[1]
-            ).id
-        except DoesNotExist:
-            raise UnknownObject
+    key = (key[0], key[1])
+    database = ActivityDataset._meta.database
+    if not database.in_transaction():
+        if _id_cache is None or _id_cache_db is not database:
+            _build_id_cache()
+        if key in _id_cache:
+            return _id_cache[key]
+    # Inside a transaction, or the node was created by another process. Not
+    # cached, as the row could still be rolled back or deleted elsewhere.
+    try:
+        return ActivityDataset.get(
+            ActivityDataset.database == key[0], ActivityDataset.code == key[1]
+        ).id
+    except DoesNotExist:
+        raise UnknownObject
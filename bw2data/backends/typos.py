@@ -1,5 +1,5 @@
 import warnings
-from functools import partial
+from functools import lru_cache, partial
 from typing import Iterable
 
 from ..configuration import typo_settings
@@ -14,6 +14,12 @@ except ImportError:
     from ..string_distance import damerau_levenshtein
 
 
+@lru_cache(maxsize=100_000)
+def _distance(first: str, second: str) -> int:
+    """Damerau-Levenshtein distance, cached as the same keys recur across datasets."""
+    return damerau_levenshtein(first, second)
+
+
 def _check_type(type_value: str, kind: str, valid: Iterable[str]) -> None:
     """
     Validates the `type_value against a set of valid types. If the `type_value`
@@ -41,10 +47,7 @@ def _check_type(type_value: str, kind: str, valid: Iterable[str]) -> None:
     """
     if type_value and type_value not in valid and isinstance(type_value, str):
         possibles = sorted(
-            (
-                (damerau_levenshtein(type_value, possible), possible)
-                for possible in valid
-            ),
+            ((_distance(type_value, possible), possible) for possible in valid),
             key=lambda x: x[0],
         )
 
@@ -84,7 +87,7 @@ def _check_keys(obj: dict, kind: str, valid: Iterable[str]) -> None:
     for key in obj:
         if key not in valid and isinstance(key, str):
             possibles = sorted(
-                ((damerau_levenshtein(key, possible), possible) for possible in valid),
+                ((_distance(key, possible), possible) for possible in valid),
                 key=lambda x: x[0],
             )
             if possibles and possibles[0][0] < 2 and len(possibles[0][1]) >= len(key):
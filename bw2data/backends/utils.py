@@ -1,19 +1,20 @@
 import copy
+import math
 import warnings
 
-import numpy as np
-
 from .. import config
 from ..configuration import labels
 from ..errors import InvalidExchange, UntypedExchange
 from ..meta import databases, methods
+from . import sqlite3_lci_db
 from .schema import get_id
 
 
 def get_csv_data_dict(ds):
     fields = {"name", "reference product", "unit", "location"}
     dd = {field: ds.get(field) for field in fields}
-    dd["id"] = get_id(ds)
+    # Nodes loaded from the database already carry their id
+    dd["id"] = ds.get("id") or get_id(ds)
     return dd
 
 
@@ -23,8 +24,8 @@ def convert_backend(database_name, backend):
     bw2data currently supports the `default` and `json` backends.
 
     Args:
-        * `database_name` (unicode): Name of database.
-        * `backend` (unicode): Type of database. `backend` should be recoginized by `DatabaseChooser`.
+        * `database_name` (str): Name of database.
+        * `backend` (str): Type of database. `backend` should be recoginized by `DatabaseChooser`.
 
     Returns `False` if the old and new backend are the same. Otherwise returns an instance of the new Database object.
     """
@@ -57,10 +58,31 @@ def check_exchange(exc):
         raise UntypedExchange
     if "amount" not in exc or "input" not in exc:
         raise InvalidExchange
-    if np.isnan(exc["amount"]) or np.isinf(exc["amount"]):
+    # ``math.isfinite`` is much faster than numpy on scalars, and this runs per edge
+    if not math.isfinite(exc["amount"]):
         raise ValueError("Invalid amount in exchange {}".format(exc))
 
 
+def executemany_rows(model, rows: list) -> None:
+    """Insert ``rows`` (dictionaries with the same keys) with a single ``executemany``.
+
+    Values are still converted by the peewee fields, but no query object is built
+    for the rows, which is around twice as fast as ``Model.insert_many``.
+
+    Writes through the raw connection, bypassing peewee's query layer, so it
+    doesn't open a transaction itself; call it inside ``sqlite3_lci_db.atomic()``.
+    """
+    fields = [model._meta.fields[name] for name in rows[0]]
+    sql = 'INSERT INTO "{}" ({}) VALUES ({})'.format(
+        model._meta.table_name,
+        ", ".join('"{}"'.format(field.column_name) for field in fields),
+        ", ".join("?" * len(fields)),
+    )
+    sqlite3_lci_db.db.connection().executemany(
+        sql, [[field.db_value(row[field.name]) for field in fields] for row in rows]
+    )
+
+
 def dict_as_activitydataset(ds):
     return {
         "data": ds,
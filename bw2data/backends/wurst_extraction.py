@@ -1,5 +1,7 @@
 import copy
+from collections import defaultdict
 
+from peewee import chunked
 from tqdm import tqdm
 
 from ..configuration import labels
@@ -81,7 +83,7 @@ def add_exchanges_to_consumers(
     lookup = {(o["database"], o["code"]): o for o in activities}
 
     with tqdm(total=exchange_qs.count()) as pbar:
-        for i, exc in enumerate(exchange_qs):
+        for i, exc in enumerate(exchange_qs.iterator()):
             exc = extract_exchange(exc, add_properties=add_properties)
             output = tuple(exc.pop("output"))
             lookup[output]["exchanges"].append(exc)
@@ -115,7 +117,21 @@ def add_input_info_for_indigenous_exchanges(activities, names, add_identifiers=F
 def add_input_info_for_external_exchanges(activities, names, add_identifiers=False):
     """Add details on exchange inputs from other databases"""
     names = set(names)
+    codes_by_database = defaultdict(set)
+    for ds in activities:
+        for exc in ds["exchanges"]:
+            if "input" in exc and exc["input"][0] not in names:
+                codes_by_database[exc["input"][0]].add(exc["input"][1])
+
+    # Resolve all inputs with a few bulk queries instead of one query per input
     cache = {}
+    for database, codes in codes_by_database.items():
+        for batch in chunked(codes, 500):
+            qs = ActivityDataset.select().where(
+                (ActivityDataset.database == database) & (ActivityDataset.code << batch)
+            )
+            for obj in qs.iterator():
+                cache[(obj.database, obj.code)] = obj
 
     for ds in tqdm(activities):
         for exc in ds["exchanges"]:
@@ -117,6 +117,7 @@ def prepare_lca_inputs(
                 for d, c, i in AD.select(AD.database, AD.code, AD.id)
                 .where(AD.database << database_names)
                 .tuples()
+                .iterator()
             }
             remapping_dicts = {
                 "activity": reversed_mapping,
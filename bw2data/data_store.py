@@ -4,13 +4,13 @@ from bw_processing import (
     clean_datapackage_name,
     create_datapackage,
     load_datapackage,
-    safe_filename,
 )
 from fsspec.implementations.zip import ZipFileSystem
 
 from . import projects
 from .errors import MissingIntermediateData, UnknownObject
 from .fatomic import open as atomic_open
+from .filesystem import safe_filename
 
 
 class DataStore:
@@ -1,9 +1,16 @@
 import hashlib
 import os
 import re
+from functools import lru_cache
+
+from bw_processing import safe_filename as _safe_filename
 
 re_slugify = re.compile(r"[^\w\s-]", re.UNICODE)
 
+# The same project and database names are normalized and hashed again and again,
+# e.g. on every node save, so cache the results
+safe_filename = lru_cache(maxsize=1024)(_safe_filename)
+
 
 def create_dir(dirpath):
     "Create directory tree to `dirpath`; ignore if already exists"
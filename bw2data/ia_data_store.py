@@ -1,9 +1,8 @@
 import hashlib
 import string
 
-from bw_processing import safe_filename
-
 from .data_store import ProcessedDataStore
+from .filesystem import safe_filename
 
 
 def abbreviate(names, length=8):
@@ -68,7 +67,7 @@ class ImpactAssessmentDataStore(ProcessedDataStore):
         else:
             name = tuple(name)
 
-        return super(ImpactAssessmentDataStore, self).copy(name)
+        return super().copy(name)
 
     def register(self, **kwargs):
         """Register an object with the metadata store.
@@ -81,7 +80,7 @@ class ImpactAssessmentDataStore(ProcessedDataStore):
 
         """
         kwargs["abbreviation"] = abbreviate(self.name)
-        super(ImpactAssessmentDataStore, self).register(**kwargs)
+        super().register(**kwargs)
 
     @property
     def filename(self):
@@ -1,4 +1,3 @@
-import codecs
 import datetime
 import logging
 import uuid
@@ -46,7 +45,7 @@ def get_logger(name, level=logging.INFO):
 def get_io_logger(name):
     """Build a logger that records only relevent data for display later as HTML."""
     filepath = projects.logs_dir / "{}.{}.log".format(name, random_string(6))
-    handler = logging.StreamHandler(codecs.open(filepath, "w", "utf-8"))
+    handler = logging.StreamHandler(open(filepath, "w", encoding="utf-8"))
     logger = logging.getLogger(name)
     logger.propagate = False
     logger.setLevel(logging.INFO)
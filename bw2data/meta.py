@@ -12,11 +12,18 @@ class GeoMapping(PickledDict):
     """
 
     filename = "geomapping.pickle"
+    # Largest index, tracked so ``add`` doesn't have to scan all values
+    _max_index = None
 
-    def __init__(self, *args, **kwargs):
-        super(GeoMapping, self).__init__(*args, **kwargs)
+    @PickledDict.data.setter
+    def data(self, value):
+        self._data = value
+        self._max_index = None
+
+    def load(self):
+        super().load()
         # At a minimum, "GLO" should always be present
-        if "GLO" not in self:
+        if "GLO" not in self.data:
             self.add(["GLO"])
 
     def add(self, keys):
@@ -26,11 +33,19 @@ class GeoMapping(PickledDict):
             * *keys* (list): The keys to add.
 
         """
-        index = max(self.data.values()) if self.data else 0
-        for i, key in enumerate(keys):
-            if key not in self.data:
-                self.data[key] = index + i + 1
-        self.flush()
+        data = self.data
+        if self._max_index is None:
+            self._max_index = max(data.values()) if data else 0
+        index = self._max_index
+        new = {}
+        for key in keys:
+            if key not in data and key not in new:
+                index += 1
+                new[key] = index
+        if new:
+            data.update(new)
+            self._max_index = index
+            self.flush()
 
     def delete(self, keys):
         """Delete a set of keys.
@@ -105,7 +120,7 @@ class Databases(SerializedDict):
         except:
             pass
 
-        super(Databases, self).__delitem__(name)
+        super().__delitem__(name)
 
 
 class CalculationSetups(PickledDict):
@@ -155,11 +170,11 @@ class Preferences(PickledDict):
 
     filename = "preferences.pickle"
 
-    def __init__(self, *args, **kwargs):
-        super(Preferences, self).__init__(*args, **kwargs)
+    def load(self):
+        super().load()
 
         # Default preferences
-        if "use_cache" not in self:
+        if "use_cache" not in self.data:
             self["use_cache"] = True
 
 
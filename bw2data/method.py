@@ -92,7 +92,7 @@ class Method(ImpactAssessmentDataStore):
 
         self.metadata["geocollections"] = sorted(geocollections)
         self._metadata.flush()
-        super(Method, self).write(data, process=process)
+        super().write(data, process=process)
 
     def process(self, **extra_metadata):
         try:
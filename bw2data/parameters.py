@@ -86,7 +86,7 @@ class ParameterBase(Model):
 
     @classmethod
     def create_table(cls):
-        super(ParameterBase, cls).create_table()
+        super().create_table()
         cls._meta.database.execute_sql(
             AUTOUPDATE_TRIGGER.format(
                 action="INSERT", name=cls._new_name, table=cls._db_table
@@ -138,7 +138,7 @@ class ProjectParameter(ParameterBase):
 
     def save(self, *args, **kwargs):
         Group.get_or_create(name="project")[0].expire()
-        super(ProjectParameter, self).save(*args, **kwargs)
+        super().save(*args, **kwargs)
 
     @staticmethod
     def load(group=None):
@@ -457,7 +457,7 @@ class DatabaseParameter(ParameterBase):
     def save(self, *args, **kwargs):
         """Save this model instance"""
         Group.get_or_create(name=self.database)[0].expire()
-        super(DatabaseParameter, self).save(*args, **kwargs)
+        super().save(*args, **kwargs)
 
     def is_deletable(self):
         """Perform a test to see if the current parameter can be deleted."""
@@ -860,7 +860,7 @@ class ActivityParameter(ParameterBase):
     def save(self, *args, **kwargs):
         """Save this model instance"""
         Group.get_or_create(name=self.group)[0].expire()
-        super(ActivityParameter, self).save(*args, **kwargs)
+        super().save(*args, **kwargs)
 
     def is_deletable(self):
         """Perform a test to see if the current parameter can be deleted."""
@@ -1029,7 +1029,7 @@ class ActivityParameter(ParameterBase):
 
     @classmethod
     def create_table(cls):
-        super(ActivityParameter, cls).create_table()
+        super().create_table()
         cls._meta.database.execute_sql(CROSSDATASE_UPDATE_TRIGGER)
         cls._meta.database.execute_sql(CROSSDATASE_INSERT_TRIGGER)
         cls._meta.database.execute_sql(CROSSGROUP_UPDATE_TRIGGER)
@@ -1058,13 +1058,13 @@ class ParameterizedExchange(Model):
 
     @classmethod
     def create_table(cls):
-        super(ParameterizedExchange, cls).create_table()
+        super().create_table()
         cls._meta.database.execute_sql(PE_UPDATE_TRIGGER)
         cls._meta.database.execute_sql(PE_INSERT_TRIGGER)
 
     def save(self, *args, **kwargs):
         Group.get_or_create(name=self.group)[0].expire()
-        super(ParameterizedExchange, self).save(*args, **kwargs)
+        super().save(*args, **kwargs)
         # Push the changed formula to the Exchange.
         exc = ExchangeDataset.get_or_none(id=self.exchange)
         if exc and exc.data.get("formula") != self.formula:
@@ -1106,7 +1106,7 @@ class Group(Model):
     def save(self, *args, **kwargs):
         """Save this model instance. Will remove 'project' and database names from ``order``."""
         self.purge_order()
-        super(Group, self).save(*args, **kwargs)
+        super().save(*args, **kwargs)
 
     def purge_order(self):
         reserved = set(databases).union(set(["project"]))
@@ -1129,11 +1129,11 @@ class GroupDependency(Model):
             raise ValueError("`project` group can't have dependencies")
         elif self.group in databases and self.depends != "project":
             raise ValueError("Database groups can only depend on `project`")
-        super(GroupDependency, self).save(*args, **kwargs)
+        super().save(*args, **kwargs)
 
     @classmethod
     def create_table(cls):
-        super(GroupDependency, cls).create_table()
+        super().create_table()
         cls._meta.database.execute_sql(GD_UPDATE_TRIGGER)
         cls._meta.database.execute_sql(GD_INSERT_TRIGGER)
 
@@ -7,12 +7,11 @@ from pathlib import Path
 from typing import Optional
 
 import wrapt
-from bw_processing import safe_filename
 from peewee import SQL, BooleanField, DoesNotExist, Model, TextField
 from platformdirs import PlatformDirs
 
 from . import config
-from .filesystem import create_dir
+from .filesystem import create_dir, safe_filename
 from .sqlite import PickleField, SubstitutableDatabase
 from .utils import maybe_path
 
@@ -280,6 +279,9 @@ class ProjectManager(Iterable):
         ProjectDataset.create(
             data=project_data, name=new_name, full_hash=self.dataset.full_hash
         )
+        # Make sure the database files are complete without their write-ahead logs
+        for _, substitutable_db in config.sqlite3_databases:
+            substitutable_db.checkpoint()
         shutil.copytree(self.dir, fp)
         create_dir(self._base_logs_dir / safe_filename(new_name))
         if switch:
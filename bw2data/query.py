@@ -23,6 +23,13 @@ operators = {
     "len": lambda x, y: len(x) == y,
 }
 
+# Case-insensitive operators for when the filter value is already lowercased
+prelowered_operators = {
+    "iis": lambda x, y: x.lower() == y,
+    "inot": lambda x, y: x.lower() != y,
+    "ihas": lambda x, y: y in x.lower(),
+}
+
 
 def try_op(f, x, y):
     try:
@@ -70,7 +77,8 @@ class Result:
     def __repr__(self):
         if not self.result:
             return "Query result:\n\tNo query results found."
-        data = list(self.result.items())[:20]
+        # Don't copy the whole result just to show the first entries
+        data = itertools.islice(self.result.items(), 20)
         return "Query result: (total %i)\n" % len(self.result) + "\n".join(
             ["%s: %s" % (k, v.get("name", "Unknown")) for k, v in data]
         )
@@ -104,9 +112,6 @@ class Result:
     def items(self):
         return self.result.items()
 
-    def items(self):
-        return self.result.items()
-
     def __getitem__(self, key):
         return self.result[key]
 
@@ -175,7 +180,11 @@ class Filter:
         self.key = key
         self.function = function
         self.value = value
-        if not callable(function):
+        if isinstance(value, str) and function in ("iis", "inot", "ihas"):
+            # Lowercase the filter value once instead of for every dataset
+            self.function = prelowered_operators[function]
+            self.value = value.lower()
+        elif not callable(function):
             self.function = operators.get(function, None)
         if not self.function:
             raise ValueError("No valid function found")
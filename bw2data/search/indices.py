@@ -29,10 +29,11 @@ class IndexManager:
             if isinstance(string, tuple):
                 string = string[1]
             if isinstance(string, str):
-                if string.lower() == "none":
+                string = string.lower()
+                if string == "none":
                     return ""
                 else:
-                    return string.lower().strip()
+                    return string.strip()
             else:
                 return ""
 
@@ -3,6 +3,7 @@ import os
 import pickle
 import random
 from collections.abc import MutableMapping
+from contextlib import contextmanager
 from time import time
 
 from . import projects
@@ -34,14 +35,16 @@ class JsonWrapper:
 
     @classmethod
     def load(self, file):
-        if anyjson:
-            return anyjson.deserialize(open(file, encoding="utf-8").read())
-        else:
-            return json.load(open(file, encoding="utf-8"))
+        with open(file, encoding="utf-8") as f:
+            if anyjson:
+                return anyjson.deserialize(f.read())
+            else:
+                return json.load(f)
 
     @classmethod
     def load_bz2(self, filepath):
-        return JsonWrapper.loads((bz2.BZ2File(filepath).read()).decode("utf-8"))
+        with bz2.BZ2File(filepath) as f:
+            return JsonWrapper.loads(f.read().decode("utf-8"))
 
     @classmethod
     def dumps(self, data):
@@ -97,15 +100,37 @@ class JsonSanitizer:
 class SerializedDict(MutableMapping):
     """Base class for dictionary that can be `serialized <http://en.wikipedia.org/wiki/Serialization>`_ to or unserialized from disk. Uses JSON as its storage format. Has most of the methods of a dictionary.
 
-    Upon instantiation, the serialized dictionary is read from disk."""
+    The serialized dictionary is read from disk the first time its data is accessed."""
+
+    # Number of open ``batch`` blocks, and whether a flush was deferred by them
+    _batch_depth = 0
+    _dirty = False
+    _data = None
 
     def __init__(self, dirpath=None):
         if not getattr(self, "filename"):
             raise NotImplementedError(
                 "SerializedDict must be subclassed, and the filename must be set."
             )
+        if self._dirty and self._data is not None:
+            # Reinitialized (e.g. by a project switch) inside a ``batch`` block;
+            # write the pending changes to the old file first
+            self.serialize()
+        self._batch_depth = 0
+        self._dirty = False
         self.filepath = (maybe_path(dirpath) or projects.dir) / self.filename
-        self.load()
+        # Loaded lazily, so that importing ``bw2data`` doesn't read every file
+        self._data = None
+
+    @property
+    def data(self):
+        if self._data is None:
+            self.load()
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value
 
     def load(self):
         """Load the serialized data. Creates the file if not yet present."""
@@ -117,8 +142,34 @@ class SerializedDict(MutableMapping):
             self.flush()
 
     def flush(self):
-        """Serialize the current data to disk."""
-        self.serialize()
+        """Serialize the current data to disk. Deferred until the end of a ``batch`` block."""
+        if self._batch_depth:
+            self._dirty = True
+        else:
+            self.serialize()
+            self._dirty = False
+
+    @contextmanager
+    def batch(self):
+        """Context manager which writes the data to disk only once, at the end of the block, instead of on every change.
+
+        Usage:
+
+        .. code-block:: python
+
+            with databases.batch():
+                for node in nodes:
+                    node.save()
+
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            # Can already be zero if ``__init__`` was called inside the block
+            self._batch_depth = max(self._batch_depth - 1, 0)
+            if not self._batch_depth and self._dirty:
+                self.flush()
 
     @property
     def list(self):
@@ -223,7 +274,8 @@ class PickledDict(SerializedDict):
 
     def deserialize(self):
         try:
-            return self.unpack(pickle.load(open(self.filepath, "rb")))
+            with open(self.filepath, "rb") as f:
+                return self.unpack(pickle.load(f))
         except ImportError:
             TEXT = "Pickle deserialization error in file '%s'" % self.filepath
             raise PickleError(TEXT)
@@ -6,20 +6,33 @@ from peewee import BlobField, SqliteDatabase, TextField
 
 class PickleField(BlobField):
     def db_value(self, value):
-        return super(PickleField, self).db_value(pickle.dumps(value, protocol=4))
+        return super().db_value(pickle.dumps(value, protocol=4))
 
     def python_value(self, value):
         return pickle.loads(bytes(value))
 
 
 class SubstitutableDatabase:
+    # Applied to every SQLite file: ``projects.db``, ``parameters.db`` and
+    # ``lci/databases.db``. The cache and mmap sizes are upper limits, not
+    # allocations. WAL lets readers proceed during writes; with WAL,
+    # ``synchronous=normal`` is still safe against corruption, only the last
+    # commits can be lost on power loss
+    pragmas = {
+        "journal_mode": "wal",
+        "synchronous": "normal",
+        "temp_store": "memory",
+        "cache_size": -262144,  # 256 MB
+        "mmap_size": 268435456,
+    }
+
     def __init__(self, filepath, tables):
         self._filepath = filepath
         self._tables = tables
         self._database = self._create_database()
 
     def _create_database(self):
-        db = SqliteDatabase(self._filepath)
+        db = SqliteDatabase(self._filepath, pragmas=self.pragmas)
         for model in self._tables:
             model.bind(db, bind_refs=False, bind_backrefs=False)
         db.connect()
@@ -44,6 +57,10 @@ class SubstitutableDatabase:
     def transaction(self):
         return self.db.transaction()
 
+    def checkpoint(self):
+        """Write the contents of the write-ahead log back into the database file"""
+        self.execute_sql("PRAGMA wal_checkpoint(TRUNCATE);")
+
     def vacuum(self):
         print("Vacuuming database ")
         self.execute_sql("VACUUM;")
@@ -7,7 +7,6 @@ import warnings
 from pathlib import Path
 
 import numpy as np
-from bw_processing import safe_filename
 from tqdm import tqdm
 
 from . import (
@@ -23,6 +22,7 @@ from . import (
     weightings,
 )
 from .backends import sqlite3_lci_db
+from .filesystem import safe_filename
 
 hash_re = re.compile("^[a-zA-Z0-9]{32}$")
 is_hash = lambda x: bool(hash_re.match(x))
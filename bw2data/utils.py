@@ -228,6 +228,7 @@ def merge_databases(parent_db, other):
         ActivityDataset,
         ExchangeDataset,
         SQLiteBackend,
+        invalidate_id_cache,
         sqlite3_lci_db,
     )
     from .database import Database
@@ -241,13 +242,20 @@ def merge_databases(parent_db, other):
     if type(first) != SQLiteBackend or type(second) != SQLiteBackend:
         raise ValidityError("Both databases must be `SQLiteBackend`")
 
+    # Only select the ``code`` column to avoid unpickling ``data`` for every node
     first_codes = {
-        obj.code
-        for obj in ActivityDataset.select().where(ActivityDataset.database == parent_db)
+        code
+        for (code,) in ActivityDataset.select(ActivityDataset.code)
+        .where(ActivityDataset.database == parent_db)
+        .tuples()
+        .iterator()
     }
     second_codes = {
-        obj.code
-        for obj in ActivityDataset.select().where(ActivityDataset.database == other)
+        code
+        for (code,) in ActivityDataset.select(ActivityDataset.code)
+        .where(ActivityDataset.database == other)
+        .tuples()
+        .iterator()
     }
     if first_codes.intersection(second_codes):
         raise ValidityError("Duplicate codes - can't merge databases")
@@ -262,6 +270,7 @@ def merge_databases(parent_db, other):
         ExchangeDataset.update(output_database=parent_db).where(
             ExchangeDataset.output_database == other
         ).execute()
+    invalidate_id_cache()
 
     Database(parent_db).process()
     del databases[other]
@@ -388,7 +397,10 @@ def get_node(**kwargs):
 
     candidates = [node_class(obj.database)(obj) for obj in qs]
 
-    extended_search = any(key not in mapping for key in kwargs)
+    # Criteria which can't be checked in SQL; split out once instead of per candidate
+    extended_search = {
+        key: value for key, value in kwargs.items() if key not in mapping
+    }
     if extended_search:
         if "database" not in kwargs:
             warnings.warn(
@@ -397,11 +409,7 @@ def get_node(**kwargs):
         candidates = [
             obj
             for obj in candidates
-            if all(
-                obj.get(key) == value
-                for key, value in kwargs.items()
-                if key not in mapping
-            )
+            if all(obj.get(key) == value for key, value in extended_search.items())
         ]
     if len(candidates) > 1:
         raise MultipleResults(
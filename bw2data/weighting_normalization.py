@@ -30,7 +30,7 @@ class Weighting(ImpactAssessmentDataStore):
             self.register()
         if not isinstance(data, list) or not len(data) == 1:
             raise ValueError("Weighting data must be one-element list")
-        super(Weighting, self).write(data)
+        super().write(data)
 
     def process_row(self, row):
         """Return an empty tuple (as ``dtype_fields`` is empty), and the weighting uncertainty dictionary."""
@@ -7,9 +7,17 @@ import pandas as pd
 import pytest
 from pandas.testing import assert_frame_equal, assert_series_equal
 
-from bw2data import Database, databases, geomapping, get_activity, get_id, get_node
+from bw2data import (
+    Database,
+    databases,
+    geomapping,
+    get_activity,
+    get_id,
+    get_node,
+    projects,
+)
 from bw2data.backends import Activity as PWActivity
-from bw2data.backends import sqlite3_lci_db
+from bw2data.backends import ActivityDataset, sqlite3_lci_db
 from bw2data.database import Database
 from bw2data.errors import (
     DuplicateNode,
@@ -138,6 +146,93 @@ def test_deletes_from_database():
     ) == (0,)
 
 
+@bw2test
+def test_get_id_after_delete():
+    d = Database("biosphere")
+    d.write(biosphere)
+    assert get_id(("biosphere", "1")) == d.get("1").id
+    del databases["biosphere"]
+    with pytest.raises(UnknownObject):
+        get_id(("biosphere", "1"))
+
+
+@bw2test
+def test_get_id_new_and_changed_code():
+    d = Database("biosphere")
+    d.write(biosphere)
+    assert get_id(("biosphere", "1"))
+    act = d.new_node(code="new", name="foo")
+    act.save()
+    assert get_id(("biosphere", "new")) == act.id
+    act["code"] = "newer"
+    assert get_id(("biosphere", "newer")) == act.id
+    with pytest.raises(UnknownObject):
+        get_id(("biosphere", "new"))
+
+
+@bw2test
+def test_get_id_right_after_rollback():
+    d = Database("db")
+    d.register()
+    with pytest.raises(ZeroDivisionError):
+        with sqlite3_lci_db.atomic():
+            x = d.new_node(code="x", name="x")
+            x.save()
+            assert get_id(("db", "x")) == x.id
+            1 / 0
+    with pytest.raises(UnknownObject):
+        get_id(("db", "x"))
+
+
+@bw2test
+def test_get_id_after_rollback():
+    d = Database("db")
+    d.register()
+    with pytest.raises(ZeroDivisionError):
+        with sqlite3_lci_db.atomic():
+            x = d.new_node(code="x", name="x")
+            x.save()
+            assert get_id(("db", "x")) == x.id
+            1 / 0
+    y = d.new_node(code="y", name="y")
+    y.save()
+    assert get_id(("db", "y")) == y.id
+    with pytest.raises(UnknownObject):
+        get_id(("db", "x"))
+
+
+@bw2test
+def test_indices_exist_for_small_databases():
+    Database("biosphere").write(biosphere)
+    indices = {
+        name
+        for (name,) in sqlite3_lci_db.execute_sql(
+            "select name from sqlite_master where type = 'index'"
+        )
+    }
+    assert {
+        "activitydataset_key",
+        "exchangedataset_input",
+        "exchangedataset_output",
+    }.issubset(indices)
+
+
+@bw2test
+def test_project_with_duplicate_keys_can_be_opened():
+    projects.set_current("duplicates")
+    sqlite3_lci_db.execute_sql('DROP INDEX IF EXISTS "activitydataset_key"')
+    for _ in range(2):
+        ActivityDataset.create(data={}, database="a", code="b")
+    projects.set_current("other")
+    projects.set_current("duplicates")
+    assert (
+        ActivityDataset.select()
+        .where(ActivityDataset.database == "a", ActivityDataset.code == "b")
+        .count()
+        == 2
+    )
+
+
 @bw2test
 def test_delete_warning():
     d = Database("biosphere")
@@ -680,6 +775,23 @@ def test_new_node_error():
         database.new_node(code="bar", id=act.id)
 
 
+@bw2test
+def test_new_node_error_checks_given_id():
+    database = Database("a database")
+    database.register()
+    first = database.new_node("foo", name="something")
+    first.save()
+    second = database.new_node("bar", name="something else")
+    second.save()
+    first.delete()
+
+    with pytest.raises(DuplicateNode):
+        database.new_node(code="baz", id=second.id)
+    # An unused id passes the duplicate check, but ``id`` can't be set
+    with pytest.raises(ValueError, match="read-only"):
+        database.new_node(code="baz", id=first.id)
+
+
 @bw2test
 def test_new_activity():
     database = Database("a database")
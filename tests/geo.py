@@ -32,11 +32,39 @@ def test_geomapping_retrieval():
     assert "foobar" in geomapping
 
 
+@bw2test
+def test_geomapping_add_incremental_indices():
+    start = max(geomapping.values())
+    geomapping.add(["a", "b"])
+    geomapping.add(["b", "c", "c"])
+    assert [geomapping[x] for x in "abc"] == [start + 1, start + 2, start + 3]
+    geomapping.__init__()
+    geomapping.add(["d"])
+    assert geomapping["d"] == start + 4
+
+
 @bw2test
 def test_glo_always_present():
     assert config.global_location in geomapping
 
 
+@bw2test
+def test_geomapping_add_after_assigning_data():
+    geomapping.__init__()
+    geomapping.data = {"foo": 5}
+    geomapping.add(["bar"])
+    assert geomapping["bar"] == 6
+
+
+@bw2test
+def test_geomapping_loaded_lazily():
+    geomapping.add(["foo"])
+    geomapping.__init__()
+    assert geomapping._data is None
+    assert "foo" in geomapping
+    assert config.global_location in geomapping
+
+
 def test_method_process_adds_correct_geo(add_method):
     method = Method(("test method",))
     package = load_datapackage(ZipFileSystem(method.filepath_processed()))
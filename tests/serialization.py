@@ -1,6 +1,14 @@
 import unittest
 
-from bw2data.serialization import JsonSanitizer
+import pytest
+
+from bw2data import databases, projects
+from bw2data.serialization import JsonSanitizer, SerializedDict
+from bw2data.tests import bw2test
+
+
+class Numbers(SerializedDict):
+    filename = "numbers.json"
 
 
 class JsonSantizierTestCase(unittest.TestCase):
@@ -32,3 +40,39 @@ class JsonSantizierTestCase(unittest.TestCase):
         ]
         self.assertEqual(JsonSanitizer.sanitize(input_data), expected)
         self.assertEqual(JsonSanitizer.load(expected), input_data)
+
+
+@bw2test
+def test_batch_flushes_once():
+    numbers = Numbers()
+    numbers["foo"] = 1
+    with numbers.batch():
+        numbers["bar"] = 2
+        with numbers.batch():
+            numbers["baz"] = 3
+        assert "bar" not in Numbers()
+    assert Numbers().data == {"foo": 1, "bar": 2, "baz": 3}
+
+
+@bw2test
+def test_batch_flushes_on_exception():
+    numbers = Numbers()
+    with pytest.raises(ZeroDivisionError):
+        with numbers.batch():
+            numbers["foo"] = 1
+            1 / 0
+    assert Numbers().data == {"foo": 1}
+    assert not numbers._batch_depth
+
+
+@bw2test
+def test_batch_survives_project_switch():
+    start = projects.current
+    with databases.batch():
+        databases["b"] = {}
+        projects.set_current("other")
+    assert "b" not in databases
+    databases["c"] = {}
+    assert "c" in databases.__class__()
+    projects.set_current(start)
+    assert "b" in databases
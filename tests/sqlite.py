@@ -29,3 +29,10 @@ def test_switch_project_correctly_switches_database_objects():
     projects.set_current("new one")
     assert not table.select().count()
     assert current_db_location != db.db.database
+
+
+@bw2test
+def test_database_uses_write_ahead_log():
+    assert db.execute_sql("PRAGMA journal_mode;").fetchone()[0] == "wal"
+    projects.set_current("new one")
+    assert db.execute_sql("PRAGMA journal_mode;").fetchone()[0] == "wal"